@@ -0,0 +1,28 @@
+// Custom functions for dash-ag-grid, exposed via the dagfuncs namespace.
+var dagfuncs = window.dashAgGridFunctions = window.dashAgGridFunctions || {};
+
+// Status labels, mirroring STATUS_OPTIONS in shortlist_viewer.py. Formatting
+// the label clientside keeps status_label out of every row dict sent to the
+// grid and the shortlist store.
+dagfuncs.STATUS_LABELS = {
+    new: 'New',
+    on_hold: 'On Hold',
+    to_contact: 'To Contact',
+    contacted: 'Contacted',
+    meeting_scheduled: 'Meeting Scheduled',
+    in_conversation: 'In Conversation',
+    follow_up: 'Follow Up',
+    proposal_requested: 'Proposal Requested',
+    proposal_sent: 'Proposal Sent',
+    closed_positive: 'Closed (Positive)',
+    closed_negative: 'Closed (Negative)',
+    closed_referrer: 'Closed (Potential Referrer)',
+};
+
+dagfuncs.statusLabel = function (params) {
+    var label = dagfuncs.STATUS_LABELS[params.value] || 'New';
+    if (params.value === 'follow_up' && params.data && params.data.follow_up_date) {
+        label = 'Follow Up (' + params.data.follow_up_date + ')';
+    }
+    return label;
+};